@@ -0,0 +1,97 @@
+import time
+from collections import OrderedDict
+from typing import Any
+from typing import Callable
+from typing import Dict
+from typing import Optional
+from typing import Tuple
+from typing import Type
+
+from tortoise import Model
+from tortoise.signals import Signals
+
+
+_invalidation_listeners: Dict[Tuple[type, int], Callable] = {}
+
+
+class BaseCache:
+    """
+    Async interface of cache backend, implement it to store values out of process (e.g. redis).
+    Value of `ttl` is seconds, `None` means default ttl of cache and `0` means value never expires.
+    """
+
+    async def get(self, key: str, default: Any = None) -> Any:
+        raise NotImplementedError()
+
+    async def set(self, key: str, value: Any, ttl: Optional[float] = None) -> None:
+        raise NotImplementedError()
+
+    async def delete(self, key: str) -> None:
+        raise NotImplementedError()
+
+    async def clear(self) -> None:
+        raise NotImplementedError()
+
+
+class MemoryCache(BaseCache):
+    """In-process cache with LRU eviction and TTL expiration"""
+
+    def __init__(self, maxsize: int = 1024, ttl: Optional[float] = 60):
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self._data: "OrderedDict[str, Tuple[Optional[float], Any]]" = OrderedDict()
+
+    def __len__(self) -> int:
+        return len(self._data)
+
+    async def get(self, key: str, default: Any = None) -> Any:
+        if key not in self._data:
+            return default
+
+        expires, value = self._data[key]
+        if expires is not None and expires <= time.monotonic():
+            del self._data[key]
+            return default
+
+        self._data.move_to_end(key)
+        return value
+
+    async def set(self, key: str, value: Any, ttl: Optional[float] = None) -> None:
+        ttl = self.ttl if ttl is None else ttl
+        self._data[key] = (time.monotonic() + ttl if ttl else None, value)
+        self._data.move_to_end(key)
+        while len(self._data) > self.maxsize:
+            self._data.popitem(last=False)
+
+    async def delete(self, key: str) -> None:
+        self._data.pop(key, None)
+
+    async def clear(self) -> None:
+        self._data.clear()
+
+
+def _get_model_version_key(model: Type[Model]) -> str:
+    return f"fastapi-querysets:version:{model.__module__}.{model.__qualname__}"
+
+
+async def get_model_version(cache: BaseCache, model: Type[Model]) -> int:
+    """Return version of model data, version is changed by `invalidate_model`"""
+    return await cache.get(_get_model_version_key(model), 0)
+
+
+async def invalidate_model(cache: BaseCache, model: Type[Model]) -> None:
+    """Change version of model data, so cached values of previous version are not used anymore"""
+    await cache.set(_get_model_version_key(model), time.time_ns(), ttl=0)
+
+
+def connect_model_invalidation(cache: BaseCache, model: Type[Model]) -> None:
+    """Invalidate model on `post_save` and `post_delete` signals, bulk operations don't send signals"""
+    if (model, id(cache)) in _invalidation_listeners:
+        return
+
+    async def listener(sender: Type[Model], *args, **kwargs) -> None:
+        await invalidate_model(cache, sender)
+
+    _invalidation_listeners[(model, id(cache))] = listener
+    model.register_listener(Signals.post_save, listener)
+    model.register_listener(Signals.post_delete, listener)
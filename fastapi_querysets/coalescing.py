@@ -0,0 +1,38 @@
+import asyncio
+from typing import Any
+from typing import Dict
+from typing import Hashable
+from typing import Tuple
+
+from tortoise.queryset import AwaitableQuery
+
+
+class SingleFlight:
+    """Coalesce identical concurrent queries, followers await result of the query executed by leader"""
+
+    def __init__(self):
+        self._flights: Dict[Hashable, asyncio.Future] = {}
+
+    def __len__(self) -> int:
+        return len(self._flights)
+
+    async def execute(self, key: Hashable, query: AwaitableQuery) -> Any:
+        if (flight := self._flights.get(key)) is None:
+            flight = self._flights[key] = asyncio.ensure_future(query)
+            flight.add_done_callback(lambda _: self._flights.pop(key, None))
+
+        # cancellation of any request must not cancel query awaited by other requests
+        result = await asyncio.shield(flight)
+        return list(result) if isinstance(result, list) else result
+
+
+def get_query_key(query: AwaitableQuery, kind: str) -> Tuple[str, str, str]:
+    """
+    Key is built from compiled SQL with params and connection of query.
+    Kind distinguishes queries with the same SQL and different results (e.g. rows and single instance).
+    """
+    db = query._db or query._choose_db()
+    return kind, db.connection_name, query.sql()
+
+
+singleflight = SingleFlight()
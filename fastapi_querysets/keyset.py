@@ -0,0 +1,109 @@
+import base64
+import binascii
+import datetime
+import decimal
+import json
+import uuid
+from collections import namedtuple
+from typing import Any
+from typing import Dict
+from typing import Sequence
+from typing import Tuple
+
+from pypika import Order
+from tortoise.expressions import Q
+from tortoise.queryset import QuerySet
+
+
+Cursor = namedtuple("Cursor", "ordering values reverse")
+
+
+def get_keyset_ordering(queryset: QuerySet, pk_model: str) -> Tuple[str, ...]:
+    """Return effective ordering of queryset with primary key as tiebreaker"""
+    orderings = queryset._orderings
+    if not orderings and not queryset._annotations:
+        orderings = queryset.model._meta.ordering
+
+    ordering = tuple(f"-{field}" if order == Order.desc else field for field, order in orderings)
+    if pk_model not in (field.lstrip("-") for field in ordering):
+        ordering += (pk_model,)
+    return ordering
+
+
+def get_keyset_ordering_reversed(ordering: Sequence[str]) -> Tuple[str, ...]:
+    return tuple(field[1:] if field.startswith("-") else f"-{field}" for field in ordering)
+
+
+def keyset_filter(
+    queryset: QuerySet,
+    ordering: Sequence[str],
+    values: Sequence[Any],
+    reverse: bool = False,
+    inclusive: bool = False,
+) -> QuerySet:
+    """Restrict queryset to rows placed after (or before if reverse) `values` according to ordering"""
+    conditions = []
+    equals: Dict[str, Any] = {}
+    for field, value in zip(ordering, values):
+        descending = field.startswith("-") != reverse
+        field = field.lstrip("-")
+        lookup = "lt" if descending else "gt"
+        conditions.append(Q(**equals, **{f"{field}__{lookup}": value}))
+        equals[field] = value
+
+    if inclusive:
+        conditions.append(Q(**equals))
+
+    return queryset.filter(Q(*conditions, join_type=Q.OR))
+
+
+def _encode_value(value: Any) -> Dict[str, str]:
+    if isinstance(value, datetime.datetime):
+        return {"datetime": value.isoformat()}
+    elif isinstance(value, datetime.date):
+        return {"date": value.isoformat()}
+    elif isinstance(value, datetime.time):
+        return {"time": value.isoformat()}
+    elif isinstance(value, decimal.Decimal):
+        return {"decimal": str(value)}
+    elif isinstance(value, uuid.UUID):
+        return {"uuid": str(value)}
+    raise TypeError(f"Object of type {type(value).__name__} is not cursor serializable")
+
+
+def _decode_value(value: Dict[str, Any]) -> Any:
+    if len(value) == 1:
+        (_type, _value), *_ = value.items()
+        if _type == "datetime":
+            return datetime.datetime.fromisoformat(_value)
+        elif _type == "date":
+            return datetime.date.fromisoformat(_value)
+        elif _type == "time":
+            return datetime.time.fromisoformat(_value)
+        elif _type == "decimal":
+            return decimal.Decimal(_value)
+        elif _type == "uuid":
+            return uuid.UUID(_value)
+    return value
+
+
+def encode_cursor(cursor: Cursor) -> str:
+    data = {"o": list(cursor.ordering), "v": list(cursor.values), "r": int(cursor.reverse)}
+    payload = json.dumps(data, default=_encode_value, separators=(",", ":"))
+    return base64.urlsafe_b64encode(payload.encode()).decode().rstrip("=")
+
+
+def decode_cursor(token: str) -> Cursor:
+    """Raise ValueError if token is not valid cursor"""
+    try:
+        payload = base64.urlsafe_b64decode(token + "=" * (-len(token) % 4))
+        data = json.loads(payload, object_hook=_decode_value)
+    except (binascii.Error, UnicodeDecodeError, ArithmeticError, TypeError, ValueError) as e:
+        raise ValueError("Invalid cursor") from e
+
+    if not isinstance(data, dict) or not isinstance(data.get("o"), list) or not isinstance(data.get("v"), list):
+        raise ValueError("Invalid cursor")
+    elif len(data["o"]) != len(data["v"]) or data.get("r") not in (0, 1):
+        raise ValueError("Invalid cursor")
+
+    return Cursor(ordering=tuple(data["o"]), values=tuple(data["v"]), reverse=bool(data["r"]))
@@ -0,0 +1,102 @@
+import hashlib
+import json
+from typing import Any
+from typing import Awaitable
+from typing import Callable
+from typing import Optional
+
+from fastapi import Depends
+from fastapi import HTTPException
+from fastapi import params
+from fastapi.encoders import jsonable_encoder
+from starlette import status
+from starlette.requests import Request
+from starlette.responses import Response
+from tortoise.queryset import QuerySet
+
+from fastapi_querysets.cache import BaseCache
+from fastapi_querysets.cache import connect_model_invalidation
+from fastapi_querysets.cache import get_model_version
+from fastapi_querysets.cache import invalidate_model
+from fastapi_querysets.mixins.pagination import Page
+from fastapi_querysets.utils import get_queryset_signature
+
+
+class ResponseCache:
+    """Serialized response of queryset, it is stored in cache and validated by `If-None-Match` header"""
+
+    def __init__(self, cache: BaseCache, ttl: Optional[float], key: str, response: Response, queryset: Any):
+        self.cache = cache
+        self.ttl = ttl
+        self.key = key
+        self.etag = f'W/"{hashlib.sha1(key.encode()).hexdigest()}"'
+        self.queryset = queryset
+        self._response = response
+
+    async def response(self, serializer: Callable[[Any], Awaitable[Any]]) -> Response:
+        """Return cached response or serialize queryset by `serializer` and cache it"""
+        if cached := await self.cache.get(self.key):
+            body, headers = cached
+        else:
+            content = await serializer(self.queryset)
+            body = json.dumps(jsonable_encoder(content), separators=(",", ":")).encode()
+            # headers of sub-response (e.g. pagination) are not merged to returned response by FastAPI
+            headers = {**self._response.headers, "etag": self.etag}
+            await self.cache.set(self.key, (body, headers), ttl=self.ttl)
+
+        return Response(content=body, headers=headers, media_type="application/json")
+
+    def is_not_modified(self, request: Request) -> bool:
+        if_none_match = request.headers.get("if-none-match")
+        if not if_none_match:
+            return False
+        return if_none_match.strip() == "*" or self.etag in [etag.strip() for etag in if_none_match.split(",")]
+
+
+class ResponseCacheMixin:
+    response_cache: BaseCache
+    response_cache_ttl: Optional[float] = None
+
+    def __init__(self, *args, **kwargs):
+        super(ResponseCacheMixin, self).__init__(*args, **kwargs)
+        connect_model_invalidation(self.response_cache, self.model)
+
+    def cached(self, dependency: params.Depends = None) -> params.Depends:
+        """
+        Wrap dependency returned queryset (e.g. `.paginated`) to dependency returned `ResponseCache`.
+        Response is not modified (304) if `If-None-Match` header matches to `ETag` of cached response.
+        """
+        dependency = dependency or self
+
+        async def get_request_response_cache(
+            request: Request,
+            response: Response,
+            queryset: Any = dependency,
+        ) -> ResponseCache:
+            key = await self._get_response_cache_key(request, queryset)
+            response_cache = ResponseCache(self.response_cache, self.response_cache_ttl, key, response, queryset)
+            if response_cache.is_not_modified(request):
+                raise HTTPException(status_code=status.HTTP_304_NOT_MODIFIED, headers={"etag": response_cache.etag})
+            return response_cache
+
+        return Depends(get_request_response_cache)
+
+    async def invalidate(self) -> None:
+        """Invalidate cached responses of model, it is required after bulk operations which don't send signals"""
+        await invalidate_model(self.response_cache, self.model)
+
+    async def _get_response_cache_key(self, request: Request, queryset: Any) -> str:
+        """
+        Key is built from model version, request path and query and queryset (filters, ordering and pagination).
+        Queryset is included because of restrictions of `get_request_queryset` which don't depend on query.
+        """
+        if isinstance(queryset, Page):
+            queryset = queryset.queryset
+
+        signature = get_queryset_signature(queryset, with_page=True) if isinstance(queryset, QuerySet) else ""
+        query = sorted(request.query_params.multi_items())
+        query_digest = hashlib.sha1(repr(query).encode()).hexdigest()
+
+        model = f"{self.model.__module__}.{self.model.__qualname__}"
+        version = await get_model_version(self.response_cache, self.model)
+        return f"fastapi-querysets:response:{model}:{version}:{request.url.path}:{query_digest}:{signature}"
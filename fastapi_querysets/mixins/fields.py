@@ -0,0 +1,38 @@
+from typing import List
+from typing import Optional
+from typing import Sequence
+
+from fastapi import Query
+from fastapi_depends_ext import DependsAttr
+from starlette import status
+from tortoise.queryset import QuerySet
+
+from fastapi_querysets.exceptions import create_validation_exception
+
+
+QUERY_FIELDS = List[str]
+
+
+class FieldsMixin:
+    fields_allowed: Sequence[str] = tuple()
+
+    def get_request_queryset(
+        self,
+        fields: Optional[QUERY_FIELDS] = Query(None, alias="fields[]"),
+        queryset: QuerySet = DependsAttr("get_request_queryset", from_super=True),
+    ) -> QuerySet:
+        if not fields:
+            return queryset
+
+        for index, field in enumerate(fields):
+            if field not in self.fields_allowed:
+                raise create_validation_exception(
+                    status_code=status.HTTP_422_UNPROCESSABLE_ENTITY,
+                    loc=["query", "fields[]", index],
+                    msg="Invalid value",
+                    _type="value_error",
+                )
+
+        # primary key and ordering fields are required to get instance and for keyset pagination
+        ordering = [field for field, _ in queryset._orderings if "__" not in field]
+        return queryset.only(*dict.fromkeys([self.pk_model, *fields, *ordering]))
@@ -1,9 +1,11 @@
 import copy
 import dataclasses
+from types import MappingProxyType
 from typing import Any
 from typing import Callable
 from typing import Dict
 from typing import List
+from typing import Mapping
 from typing import Optional
 from typing import Protocol
 from typing import Tuple
@@ -20,30 +22,64 @@ class DataclassProtocol(Protocol):
     __post_init__: Optional[Callable]
 
 
+_filters_indexes: Dict[type, Mapping[str, str]] = {}
+_negation_classes: Dict[type, type] = {}
+
+
+def get_filters_index(filters_class: DataclassProtocol) -> Mapping[str, str]:
+    """Return read only map of query param alias to field name, it is created once for every `filters_class`"""
+    if filters_class not in _filters_indexes:
+        fields = dataclasses.fields(filters_class)
+        index = {field.default.alias or field.name: field.name for field in fields}
+        _filters_indexes[filters_class] = MappingProxyType(index)
+    return _filters_indexes[filters_class]
+
+
 class BaseFilterMixin:
+    def __init_subclass__(cls, **kwargs):
+        super(BaseFilterMixin, cls).__init_subclass__(**kwargs)
+        for filters_class in (getattr(cls, "filter_class", None), getattr(cls, "exclude_class", None)):
+            if dataclasses.is_dataclass(filters_class):
+                get_filters_index(filters_class)
+
     def _get_model_filters(self, request: Request, filters: DataclassProtocol) -> Dict[str, Any]:
-        fields_map = {field.default.alias or field.name: field.name for field in dataclasses.fields(filters)}
-        _fields = set(request.query_params) & set(fields_map)
-        return {fields_map[field]: getattr(filters, fields_map[field]) for field in _fields}
+        index = get_filters_index(type(filters))
+        return {index[alias]: getattr(filters, index[alias]) for alias in request.query_params.keys() if alias in index}
+
+
+def create_negation_class(filter_class: DataclassProtocol) -> type:
+    """Create frozen dataclass with fields of `filter_class`, aliases of fields are appended by `!`"""
+    fields: List[Tuple[str, type, dataclasses.Field]] = []
+    for field in dataclasses.fields(filter_class):
+        _field = copy.copy(field)
+        if isinstance(_field.default, FieldInfo):
+            _field.default = copy.copy(_field.default)
+            _field.default.alias = f"{_field.default.alias or _field.name}!"
+
+        fields.append((_field.name, _field.type, _field))
+
+    return dataclasses.make_dataclass(f"{filter_class.__name__}Negation", fields=fields, frozen=True)
+
+
+def get_negation_class(filter_class: DataclassProtocol) -> type:
+    """Return negation class of `filter_class`, it is created once for every `filter_class`"""
+    if filter_class not in _negation_classes:
+        _negation_classes[filter_class] = create_negation_class(filter_class)
+    return _negation_classes[filter_class]
 
 
 class FilterNegationMixin(BaseFilterMixin):
-    # todo: allow to configure exclude_class directly
+    exclude_class: Optional[DataclassProtocol] = None
     filter_class: DataclassProtocol
 
-    @property
-    def exclude_class(self) -> type:
-        # todo: dedicate method to create NegationClass from dataclass
-        fields: List[Tuple[str, type, dataclasses.Field]] = []
-        for field in dataclasses.fields(self.filter_class):
-            _field = copy.copy(field)
-            if isinstance(_field.default, FieldInfo):
-                _field.default = copy.copy(_field.default)
-                _field.default.alias = f"{_field.default.alias or _field.name}!"
-
-            fields.append((_field.name, _field.type, _field))
+    def __init_subclass__(cls, **kwargs):
+        # keep exclude_class declared directly, generated one is replaced if filter_class was redefined
+        filter_class = getattr(cls, "filter_class", None)
+        if "exclude_class" not in cls.__dict__ and filter_class is not None:
+            if cls.exclude_class is None or cls.exclude_class in _negation_classes.values():
+                cls.exclude_class = get_negation_class(filter_class)
 
-        return dataclasses.make_dataclass(f"{self.filter_class.__name__}Negation", fields=fields, frozen=True)
+        super(FilterNegationMixin, cls).__init_subclass__(**kwargs)
 
     def get_request_queryset(
         self,
@@ -1,38 +1,157 @@
+import asyncio
+import functools
 import math
 from collections import namedtuple
+from typing import Any
+from typing import Awaitable
+from typing import Callable
+from typing import Final
+from typing import Generator
+from typing import List
+from typing import Optional
+from typing import Tuple
 from typing import Type
+from typing import Union
 from typing import cast
 
 from fastapi import Depends
 from fastapi import Query
 from fastapi_depends_ext import DependsAttr
+from starlette import status
 from starlette.responses import Response
+from tortoise import Model
 from tortoise.queryset import QuerySet
 
+from fastapi_querysets.cache import BaseCache
+from fastapi_querysets.exceptions import create_validation_exception
+from fastapi_querysets.keyset import Cursor
+from fastapi_querysets.keyset import decode_cursor
+from fastapi_querysets.keyset import encode_cursor
+from fastapi_querysets.keyset import get_keyset_ordering
+from fastapi_querysets.keyset import get_keyset_ordering_reversed
+from fastapi_querysets.keyset import keyset_filter
+from fastapi_querysets.utils import get_count_estimate
+from fastapi_querysets.utils import get_queryset_signature
 
-Pagination = namedtuple("SkipLimit", "skip limit")
+
+COUNT_APPROXIMATE: Final = "approximate"
+COUNT_EXACT: Final = "exact"
+COUNT_LAZY: Final = "lazy"
+COUNT_NONE: Final = "none"
+
+
+Pagination = namedtuple("SkipLimit", "skip limit with_total", defaults=(False,))
+CursorPagination = namedtuple("CursorLimit", "cursor limit")
 
 
 class RouterPagination:
     per_page_max: int = 25
     per_page: int = 25
+    count: str = COUNT_EXACT
+    count_approximate_threshold: int = 10000
+    count_cache: Optional[BaseCache] = None
+    count_short_page: bool = False
+    concurrent: bool = False
 
-    def __init__(self, per_page_max: int = None, per_page: int = None):
+    def __init__(
+        self,
+        per_page_max: int = None,
+        per_page: int = None,
+        count: str = None,
+        count_short_page: bool = None,
+        concurrent: bool = None,
+    ):
         self.per_page_max = per_page_max or self.per_page_max
         self.per_page = per_page or self.per_page
+        self.count = count or self.count
+        self.count_short_page = self.count_short_page if count_short_page is None else count_short_page
+        self.concurrent = self.concurrent if concurrent is None else concurrent
 
-    def __call__(self, page: int = Query(1, ge=1), per_page: int = Query(None, ge=1)) -> Pagination:
-        """Return value is tuple of (skip, limit)"""
+    def __call__(
+        self,
+        page: int = Query(1, ge=1),
+        per_page: int = Query(None, ge=1),
+        with_total: bool = Query(False),
+    ) -> Pagination:
+        """Return value is tuple of (skip, limit, with_total)"""
         per_page = min(self.per_page_max, per_page or self.per_page)
-        return Pagination(skip=(page - 1) * per_page, limit=per_page)
+        return Pagination(skip=(page - 1) * per_page, limit=per_page, with_total=with_total)
+
+
+class RouterCursorPagination(RouterPagination):
+    def __call__(self, cursor: Optional[str] = Query(None), per_page: int = Query(None, ge=1)) -> CursorPagination:
+        """Return value is tuple of (cursor, limit)"""
+        per_page = min(self.per_page_max, per_page or self.per_page)
+        if cursor is None:
+            return CursorPagination(cursor=None, limit=per_page)
+
+        try:
+            return CursorPagination(cursor=decode_cursor(cursor), limit=per_page)
+        except ValueError:
+            raise create_validation_exception(
+                status_code=status.HTTP_422_UNPROCESSABLE_ENTITY,
+                loc=["query", "cursor"],
+                msg="Invalid cursor",
+                _type="value_error",
+            )
+
+
+class Page:
+    """Page of queryset, rows and total are fetched concurrently on await"""
+
+    def __init__(
+        self,
+        queryset: QuerySet,
+        get_total: Optional[Callable[[], Awaitable[Tuple[int, bool]]]] = None,
+        on_total: Optional[Callable[[int, bool], Any]] = None,
+        get_items: Optional[Callable[[QuerySet], Awaitable[List[Model]]]] = None,
+    ):
+        self.queryset = queryset
+        self._get_total = get_total
+        self._on_total = on_total
+        self._get_items = get_items or (lambda queryset: queryset)
+        self._items: Optional[List[Model]] = None
+
+    def __await__(self) -> Generator[Any, None, List[Model]]:
+        return self.fetch().__await__()
+
+    async def fetch(self) -> List[Model]:
+        if self._items is not None:
+            return self._items
+
+        if self._get_total is None:
+            self._items = await self._get_items(self.queryset)
+            return self._items
+
+        self._items, (total, total_approximate) = await asyncio.gather(
+            self._get_items(self.queryset), self._get_total()
+        )
+        if self._on_total:
+            self._on_total(total, total_approximate)
+        return self._items
 
 
 class PaginationMixin:
     # todo: add per_page_min
     pagination_class: Type[RouterPagination]
 
-    def __init__(self, *args, per_page_max: int = None, per_page: int = None, **kwargs):
-        self._pagination = self.pagination_class(per_page_max=per_page_max, per_page=per_page)
+    def __init__(
+        self,
+        *args,
+        per_page_max: int = None,
+        per_page: int = None,
+        count: str = None,
+        count_short_page: bool = None,
+        concurrent: bool = None,
+        **kwargs,
+    ):
+        self._pagination = self.pagination_class(
+            per_page_max=per_page_max,
+            per_page=per_page,
+            count=count,
+            count_short_page=count_short_page,
+            concurrent=concurrent,
+        )
         super(PaginationMixin, self).__init__(*args, **kwargs)
         self.paginated = Depends(self.get_request_queryset_paginated)
 
@@ -40,13 +159,141 @@ class PaginationMixin:
         self,
         response: Response,
         queryset: QuerySet = DependsAttr("get_request_queryset"),
-        pagination: Pagination = DependsAttr("_pagination"),
-    ) -> QuerySet:
-        total = await queryset.count()
+        pagination: Union[Pagination, CursorPagination] = DependsAttr("_pagination"),
+    ) -> Union[QuerySet, Page]:
+        if isinstance(pagination, CursorPagination):
+            return await self._get_request_queryset_paginated_cursor(response, queryset, pagination)
+
+        # todo: refactor to yield queryset and the adding pagination info
+        queryset_page = queryset.offset(cast(int, pagination.skip)).limit(pagination.limit)
+
+        if self._pagination.concurrent:
+            # headers with total are set by page when rows and total are fetched
+            self._set_response_headers(response, pagination)
+            get_total = None
+            if self._is_total_required(pagination):
+                get_total = functools.partial(self._get_request_total, queryset)
+            on_total = functools.partial(self._set_response_headers, response, pagination)
+            get_items = functools.partial(self._execute, kind="rows")
+            return Page(queryset_page, get_total=get_total, on_total=on_total, get_items=get_items)
+
+        total, total_approximate = None, False
+        if self._is_total_required(pagination):
+            if self._pagination.count_short_page and not pagination.skip:
+                # short first page contains all rows, so its length is total and COUNT is not required
+                pks = await self._execute(queryset_page.values_list(self.pk_model, flat=True), "pks")
+                queryset_page = queryset_page.filter(**{f"{self.pk_model}__in": pks})
+                total = len(pks) if len(pks) < pagination.limit else None
+
+            if total is None:
+                total, total_approximate = await self._get_request_total(queryset)
+
+        self._set_response_headers(response, pagination, total, total_approximate)
+        return queryset_page
+
+    def _set_response_headers(
+        self,
+        response: Response,
+        pagination: Pagination,
+        total: Optional[int] = None,
+        total_approximate: bool = False,
+    ) -> None:
         response.headers["x-page"] = str(math.ceil(pagination.skip / pagination.limit) + 1)
-        response.headers["x-pages"] = str(math.ceil(total / pagination.limit))
         response.headers["x-per-page"] = str(pagination.limit)
+        if total is None:
+            return
+
+        response.headers["x-pages"] = str(math.ceil(total / pagination.limit))
         response.headers["x-total"] = str(total)
+        if self._pagination.count == COUNT_APPROXIMATE:
+            response.headers["x-total-approximate"] = str(total_approximate).lower()
 
-        # todo: refactor to yield queryset and the adding pagination info
-        return queryset.offset(cast(int, pagination.skip)).limit(pagination.limit)
+    async def _get_request_total(self, queryset: QuerySet) -> Tuple[int, bool]:
+        """Return value is tuple of (total, is_approximate)"""
+        cache = self._pagination.count_cache
+        if cache is not None:
+            key = self._get_request_total_key(queryset)
+            if cached := await cache.get(key):
+                total, total_approximate = cached
+                return total, total_approximate
+
+        total, total_approximate = None, False
+        if self._pagination.count == COUNT_APPROXIMATE:
+            # estimate is inaccurate for small querysets and exact count of them is cheap
+            estimate = await get_count_estimate(queryset)
+            if estimate is not None and estimate >= self._pagination.count_approximate_threshold:
+                total, total_approximate = estimate, True
+
+        if total is None:
+            total = await self._execute(queryset.count(), "count")
+
+        if cache is not None:
+            await cache.set(key, (total, total_approximate))
+        return total, total_approximate
+
+    def _get_request_total_key(self, queryset: QuerySet) -> str:
+        """
+        Key is built from model, base queryset (`get_queryset`) and filters applied to queryset.
+        Filters include values of `FilterMixin`/`FilterNegationMixin` and restrictions of `get_request_queryset`.
+        """
+        model = f"{self.model.__module__}.{self.model.__qualname__}"
+        get_queryset = f"{type(self).get_queryset.__module__}.{type(self).get_queryset.__qualname__}"
+        return f"fastapi-querysets:total:{model}:{get_queryset}:{get_queryset_signature(queryset)}"
+
+    def _is_total_required(self, pagination: Pagination) -> bool:
+        if self._pagination.count == COUNT_LAZY:
+            return pagination.with_total
+        return self._pagination.count != COUNT_NONE
+
+    async def _get_request_queryset_paginated_cursor(
+        self,
+        response: Response,
+        queryset: QuerySet,
+        pagination: CursorPagination,
+    ) -> QuerySet:
+        cursor: Optional[Cursor] = pagination.cursor
+        ordering = get_keyset_ordering(queryset, self.pk_model)
+        if cursor and cursor.ordering != ordering:
+            raise create_validation_exception(
+                status_code=status.HTTP_422_UNPROCESSABLE_ENTITY,
+                loc=["query", "cursor"],
+                msg="Cursor does not match ordering",
+                _type="value_error",
+            )
+
+        # values of ordering fields are fetched for limit + 1 rows to find page bounds without counting
+        fields = [field.lstrip("-") for field in ordering]
+        queryset = queryset.order_by(*ordering)
+        cursor_next = cursor_prev = None
+
+        if cursor and cursor.reverse:
+            queryset_reversed = keyset_filter(queryset, ordering, cursor.values, reverse=True)
+            queryset_reversed = queryset_reversed.order_by(*get_keyset_ordering_reversed(ordering))
+            rows = await self._execute(queryset_reversed.limit(pagination.limit + 1).values_list(*fields), "keyset")
+            rows, has_prev = rows[: pagination.limit][::-1], len(rows) > pagination.limit
+
+            if rows:
+                queryset = keyset_filter(queryset, ordering, rows[0], inclusive=True)
+                cursor_next = Cursor(ordering=ordering, values=rows[-1], reverse=False)
+                cursor_prev = Cursor(ordering=ordering, values=rows[0], reverse=True) if has_prev else None
+            else:
+                queryset = keyset_filter(queryset, ordering, cursor.values, reverse=True)
+
+        else:
+            if cursor:
+                queryset = keyset_filter(queryset, ordering, cursor.values)
+
+            rows = await self._execute(queryset.limit(pagination.limit + 1).values_list(*fields), "keyset")
+            rows, has_next = rows[: pagination.limit], len(rows) > pagination.limit
+
+            if rows:
+                cursor_next = Cursor(ordering=ordering, values=rows[-1], reverse=False) if has_next else None
+                cursor_prev = Cursor(ordering=ordering, values=rows[0], reverse=True) if cursor else None
+
+        response.headers["x-per-page"] = str(pagination.limit)
+        if cursor_next:
+            response.headers["x-next-cursor"] = encode_cursor(cursor_next)
+        if cursor_prev:
+            response.headers["x-prev-cursor"] = encode_cursor(cursor_prev)
+
+        return queryset.limit(pagination.limit)
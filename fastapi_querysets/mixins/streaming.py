@@ -0,0 +1,85 @@
+import json
+from typing import Any
+from typing import AsyncIterator
+from typing import Callable
+from typing import Final
+from typing import List
+
+from fastapi import Depends
+from fastapi.encoders import jsonable_encoder
+from fastapi_depends_ext import DependsAttr
+from starlette.responses import StreamingResponse
+from tortoise import Model
+from tortoise.queryset import QuerySet
+
+from fastapi_querysets.keyset import get_keyset_ordering
+from fastapi_querysets.keyset import keyset_filter
+
+
+STREAM_JSON: Final = "json"
+STREAM_NDJSON: Final = "ndjson"
+
+
+class QuerySetStream:
+    """Iterate queryset by chunks of keyset pagination, every chunk is fetched by separate query"""
+
+    def __init__(self, queryset: QuerySet, pk_model: str, chunk_size: int):
+        self.ordering = get_keyset_ordering(queryset, pk_model)
+        self.queryset = queryset.order_by(*self.ordering)
+        self.chunk_size = chunk_size
+
+    async def __aiter__(self) -> AsyncIterator[Model]:
+        async for chunk in self.chunks():
+            for instance in chunk:
+                yield instance
+
+    async def chunks(self) -> AsyncIterator[List[Model]]:
+        fields = [field.lstrip("-") for field in self.ordering]
+        queryset = self.queryset
+        while True:
+            chunk = await queryset.limit(self.chunk_size)
+            if chunk:
+                yield chunk
+            if len(chunk) < self.chunk_size:
+                return
+
+            values = [getattr(chunk[-1], field) for field in fields]
+            queryset = keyset_filter(self.queryset, self.ordering, values)
+
+    def response(self, serializer: Callable[[Model], Any], format: str = STREAM_NDJSON) -> StreamingResponse:
+        """Return response streamed instances serialized by `serializer` as NDJSON or JSON array"""
+        if format == STREAM_NDJSON:
+            return StreamingResponse(self._iter_ndjson(serializer), media_type="application/x-ndjson")
+        elif format == STREAM_JSON:
+            return StreamingResponse(self._iter_json(serializer), media_type="application/json")
+        raise ValueError(f"Unknown stream format: {format}")
+
+    async def _iter_ndjson(self, serializer: Callable[[Model], Any]) -> AsyncIterator[bytes]:
+        async for chunk in self.chunks():
+            yield "".join(f"{self._dumps(serializer(instance))}\n" for instance in chunk).encode()
+
+    async def _iter_json(self, serializer: Callable[[Model], Any]) -> AsyncIterator[bytes]:
+        separator = "["
+        async for chunk in self.chunks():
+            yield (separator + ",".join(self._dumps(serializer(instance)) for instance in chunk)).encode()
+            separator = ","
+        yield b"[]" if separator == "[" else b"]"
+
+    @staticmethod
+    def _dumps(value: Any) -> str:
+        return json.dumps(jsonable_encoder(value), separators=(",", ":"))
+
+
+class StreamingMixin:
+    stream_chunk_size: int = 1000
+
+    def __init__(self, *args, stream_chunk_size: int = None, **kwargs):
+        self.stream_chunk_size = stream_chunk_size or self.stream_chunk_size
+        super(StreamingMixin, self).__init__(*args, **kwargs)
+        self.streaming = Depends(self.get_request_queryset_streaming)
+
+    async def get_request_queryset_streaming(
+        self,
+        queryset: QuerySet = DependsAttr("get_request_queryset"),
+    ) -> QuerySetStream:
+        return QuerySetStream(queryset, self.pk_model, self.stream_chunk_size)
@@ -0,0 +1,74 @@
+from typing import Any
+from typing import Dict
+from typing import Generator
+from typing import List
+from typing import Type
+from typing import Union
+
+from fastapi import Depends
+from fastapi import params
+from pydantic import BaseModel
+from starlette.responses import Response
+from tortoise.queryset import QuerySet
+from tortoise.queryset import ValuesQuery
+
+from fastapi_querysets.mixins.pagination import Page
+from fastapi_querysets.responses import ValuesResponse
+
+
+class QuerySetValues:
+    """Rows of queryset as dicts shaped for response model, fetched without model instances"""
+
+    def __init__(self, queryset: Union[ValuesQuery, Page], response: Response):
+        self.queryset = queryset
+        self._response = response
+
+    def __await__(self) -> Generator[Any, None, List[Dict[str, Any]]]:
+        return self.queryset.__await__()
+
+    async def response(self) -> ValuesResponse:
+        # headers of sub-response (e.g. pagination) are not merged to returned response by FastAPI
+        rows = await self
+        return ValuesResponse(rows, headers=dict(self._response.headers))
+
+
+class ValuesMixin:
+    values_model: Type[BaseModel]
+
+    def __init__(self, *args, **kwargs):
+        super(ValuesMixin, self).__init__(*args, **kwargs)
+        self._values_fields = self._get_values_fields()
+
+    def as_values(self, dependency: params.Depends = None) -> params.Depends:
+        """
+        Wrap dependency returned queryset (e.g. `.paginated`) to dependency returned `QuerySetValues`.
+        Only fields of `values_model` are fetched, keys of rows are aliases of them.
+        """
+        dependency = dependency or self
+
+        async def get_request_queryset_values(response: Response, queryset: Any = dependency) -> QuerySetValues:
+            if isinstance(queryset, Page):
+                # rows are fetched by page concurrently with total
+                queryset.queryset = self._get_values_queryset(queryset.queryset)
+            else:
+                queryset = self._get_values_queryset(queryset)
+            return QuerySetValues(queryset, response)
+
+        return Depends(get_request_queryset_values)
+
+    def _get_values_queryset(self, queryset: QuerySet) -> ValuesQuery:
+        fields = self._values_fields
+        if queryset._fields_for_select:
+            # fields are restricted by `FieldsMixin`
+            fields = {alias: field for alias, field in fields.items() if field in queryset._fields_for_select}
+        return queryset.values(**fields)
+
+    def _get_values_fields(self) -> Dict[str, str]:
+        """Return map of response field alias to model field, it is created once for every `RouterQuerySet`"""
+        model_fields = self.model._meta.fields_db_projection
+        fields = {}
+        for field in self.values_model.__fields__.values():
+            if field.name not in model_fields:
+                raise ValueError(f"Field {field.name} of {self.values_model.__name__} is not field of {self.model}")
+            fields[field.alias] = field.name
+        return fields
@@ -7,17 +7,22 @@ from fastapi_depends_ext import DependsAttr
 from fastapi_depends_ext import DependsAttrBinder
 from starlette import status
 from tortoise import Model
+from tortoise.queryset import AwaitableQuery
 from tortoise.queryset import QuerySet
 
+from fastapi_querysets.coalescing import get_query_key
+from fastapi_querysets.coalescing import singleflight
 from fastapi_querysets.exceptions import create_validation_exception
 
 
 class RouterQuerySet(DependsAttrBinder, params.Depends):
     model: Model
     pk_model: str = "id"
+    coalesce: bool = False
 
-    def __init__(self, *, use_cache: bool = True):
+    def __init__(self, *, use_cache: bool = True, coalesce: bool = None):
         super(RouterQuerySet, self).__init__(use_cache=use_cache)
+        self.coalesce = self.coalesce if coalesce is None else coalesce
         self.dependency = self.get_request_queryset
         self.instance = Depends(self.get_request_instance)
 
@@ -35,7 +40,7 @@ class RouterQuerySet(DependsAttrBinder, params.Depends):
         queryset: QuerySet = DependsAttr("get_request_queryset"),
         pk: Any = Path(alias="instance_pk"),
     ) -> Model:
-        if instance := await queryset.get_or_none(**{self.pk_model: pk}):
+        if instance := await self._execute(queryset.get_or_none(**{self.pk_model: pk}), "instance"):
             return instance
 
         signature = get_typed_signature(self.get_request_instance)
@@ -48,3 +53,9 @@ class RouterQuerySet(DependsAttrBinder, params.Depends):
             msg="Instance not found",
             _type="value_error",
         )
+
+    async def _execute(self, query: AwaitableQuery, kind: str) -> Any:
+        """Execute query, identical concurrent queries are executed once if `coalesce` is enabled"""
+        if not self.coalesce:
+            return await query
+        return await singleflight.execute(get_query_key(query, kind), query)
@@ -0,0 +1,30 @@
+import datetime
+import decimal
+import enum
+import json
+import uuid
+from typing import Any
+
+from starlette.responses import JSONResponse
+
+
+def _default(value: Any) -> Any:
+    if isinstance(value, (datetime.datetime, datetime.date, datetime.time)):
+        return value.isoformat()
+    elif isinstance(value, decimal.Decimal):
+        return float(value)
+    elif isinstance(value, uuid.UUID):
+        return str(value)
+    elif isinstance(value, enum.Enum):
+        return value.value
+    raise TypeError(f"Object of type {type(value).__name__} is not JSON serializable")
+
+
+class ValuesResponse(JSONResponse):
+    """
+    JSON response of rows fetched by `values()`, rows are rendered without `jsonable_encoder`.
+    Values are encoded the same as by `jsonable_encoder` for pydantic models.
+    """
+
+    def render(self, content: Any) -> bytes:
+        return json.dumps(content, default=_default, ensure_ascii=False, separators=(",", ":")).encode("utf-8")
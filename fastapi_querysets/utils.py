@@ -0,0 +1,49 @@
+import hashlib
+import json
+from typing import Any
+from typing import Hashable
+from typing import Optional
+
+from tortoise.expressions import Q
+from tortoise.queryset import QuerySet
+
+
+def _freeze(value: Any) -> Hashable:
+    if isinstance(value, (list, tuple)):
+        return tuple(_freeze(item) for item in value)
+    elif isinstance(value, (set, frozenset)):
+        return tuple(sorted(repr(_freeze(item)) for item in value))
+    elif isinstance(value, dict):
+        return tuple(sorted((key, _freeze(item)) for key, item in value.items()))
+    return value
+
+
+def _get_q_signature(q: Q) -> str:
+    filters = sorted((key, _freeze(value)) for key, value in q.filters.items())
+    children = sorted(_get_q_signature(child) for child in q.children)
+    return repr((q.join_type, q._is_negated, filters, children))
+
+
+def get_queryset_signature(queryset: QuerySet, with_page: bool = False) -> str:
+    """
+    Return digest of normalized filters of queryset, order of filters doesn't matter.
+    If `with_page` ordering, offset and limit of queryset are included to signature too.
+    """
+    signature = sorted(_get_q_signature(q) for q in queryset._q_objects)
+    if with_page:
+        ordering = [(field, order.value) for field, order in queryset._orderings]
+        signature.append(repr((ordering, queryset._offset, queryset._limit)))
+    return hashlib.sha1(repr(signature).encode()).hexdigest()
+
+
+async def get_count_estimate(queryset: QuerySet) -> Optional[int]:
+    """Return planner estimate of rows in queryset or None if database can't estimate it"""
+    db = queryset._db or queryset._choose_db()
+    if db.capabilities.dialect != "postgres":
+        return None
+
+    rows = await db.execute_query_dict(f"EXPLAIN (FORMAT JSON) {queryset.sql()}")
+    plan = rows[0]["QUERY PLAN"]
+    if isinstance(plan, str):
+        plan = json.loads(plan)
+    return int(plan[0]["Plan"]["Plan Rows"])
@@ -0,0 +1,64 @@
+import pytest
+
+from fastapi_querysets.cache import MemoryCache
+
+
+async def test_memory_cache__set__get_value():
+    cache = MemoryCache()
+
+    await cache.set("key", 1)
+
+    assert await cache.get("key") == 1
+    assert await cache.get("key_not_exists") is None
+    assert await cache.get("key_not_exists", default=0) == 0
+
+
+async def test_memory_cache__ttl_expired__default(mocker):
+    monotonic = mocker.patch("fastapi_querysets.cache.time.monotonic", return_value=100)
+    cache = MemoryCache(ttl=10)
+
+    await cache.set("key", 1)
+    await cache.set("key_ttl", 1, ttl=20)
+
+    monotonic.return_value = 110
+    assert await cache.get("key") is None
+    assert await cache.get("key_ttl") == 1
+    assert len(cache) == 1
+
+
+@pytest.mark.parametrize("ttl", [None, 0])
+async def test_memory_cache__ttl_disabled__not_expired(mocker, ttl):
+    monotonic = mocker.patch("fastapi_querysets.cache.time.monotonic", return_value=100)
+    cache = MemoryCache(ttl=ttl)
+
+    await cache.set("key", 1)
+
+    monotonic.return_value = 10**9
+    assert await cache.get("key") == 1
+
+
+async def test_memory_cache__maxsize_exceeded__least_recently_used_evicted():
+    cache = MemoryCache(maxsize=2)
+
+    await cache.set("key_1", 1)
+    await cache.set("key_2", 2)
+    await cache.get("key_1")
+    await cache.set("key_3", 3)
+
+    assert await cache.get("key_1") == 1
+    assert await cache.get("key_2") is None
+    assert await cache.get("key_3") == 3
+
+
+async def test_memory_cache__delete_and_clear__removed():
+    cache = MemoryCache()
+    await cache.set("key_1", 1)
+    await cache.set("key_2", 2)
+
+    await cache.delete("key_1")
+    await cache.delete("key_not_exists")
+    assert await cache.get("key_1") is None
+    assert len(cache) == 1
+
+    await cache.clear()
+    assert len(cache) == 0
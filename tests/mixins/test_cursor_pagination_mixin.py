@@ -0,0 +1,134 @@
+from typing import List
+
+import pytest
+from fastapi import FastAPI
+from httpx import AsyncClient
+from tortoise.queryset import QuerySet
+
+from fastapi_querysets.keyset import Cursor
+from fastapi_querysets.keyset import encode_cursor
+from fastapi_querysets.mixins.ordering import OrderingMixin
+from fastapi_querysets.mixins.pagination import PaginationMixin
+from fastapi_querysets.mixins.pagination import RouterCursorPagination
+from fastapi_querysets.queryset import RouterQuerySet
+from tests.app_models.pydantic import TaskModelOut
+from tests.app_models.tortoise_orm import Task
+
+app = FastAPI()
+
+
+class TestRouterCursorPagination(RouterCursorPagination):
+    per_page = 15
+    per_page_max = 50
+
+
+class TasksRouterQuerySet(OrderingMixin, PaginationMixin, RouterQuerySet):
+    ordering_fields = ("id", "created_at", "workers_required_max", "workers_required_min")
+    pagination_class = TestRouterCursorPagination
+    model = Task
+
+
+@app.get("/")
+async def app_test(queryset: QuerySet[Task] = TasksRouterQuerySet().paginated) -> List[TaskModelOut]:
+    return await TaskModelOut.from_queryset(queryset)
+
+
+client = AsyncClient(app=app, base_url="http://test")
+
+
+async def fetch_pages(params: dict, header: str) -> List[List[int]]:
+    pages = []
+    response = await client.get("/", params=params)
+    while True:
+        assert response.status_code == 200
+        pages.append([task["id"] for task in response.json()])
+        if header not in response.headers:
+            return pages
+        response = await client.get("/", params={**params, "cursor": response.headers[header]})
+
+
+@pytest.mark.usefixtures("db_clean")
+async def test_cursor_pagination_mixin__db_is_clean__no_cursors():
+    response = await client.get("/")
+
+    assert response.status_code == 200
+    assert not response.json()
+    assert response.headers["x-per-page"] == str(TestRouterCursorPagination.per_page)
+    assert "x-next-cursor" not in response.headers
+    assert "x-prev-cursor" not in response.headers
+    assert "x-total" not in response.headers
+
+
+@pytest.mark.parametrize(
+    "ordering",
+    [
+        None,
+        ("id",),
+        ("-id",),
+        ("workers_required_min",),
+        ("-workers_required_min",),
+        ("created_at", "-id"),
+        ("-workers_required_min", "created_at"),
+    ],
+)
+@pytest.mark.usefixtures("db_fill")
+async def test_cursor_pagination_mixin__next_cursor__all_pages_in_order(ordering):
+    tasks_ids = await Task.all().order_by(*(ordering or ()), "id").values_list("id", flat=True)
+    per_page = TestRouterCursorPagination.per_page
+
+    pages = await fetch_pages({"ordering[]": ordering} if ordering else {}, "x-next-cursor")
+
+    assert len(pages) == len(tasks_ids) // per_page + 1
+    assert pages == [tasks_ids[index : index + per_page] for index in range(0, len(tasks_ids), per_page)]
+
+
+@pytest.mark.parametrize("ordering", [("id",), ("-workers_required_min",), ("created_at", "-id")])
+@pytest.mark.usefixtures("db_fill")
+async def test_cursor_pagination_mixin__prev_cursor__pages_are_same_as_next(ordering):
+    params = {"ordering[]": ordering, "per_page": 7}
+    pages = await fetch_pages(params, "x-next-cursor")
+
+    response = await client.get("/", params=params)
+    for _ in pages[1:]:
+        response = await client.get("/", params={**params, "cursor": response.headers["x-next-cursor"]})
+
+    pages_reversed = await fetch_pages({**params, "cursor": response.headers["x-prev-cursor"]}, "x-prev-cursor")
+
+    assert pages_reversed[::-1] == pages[:-1]
+
+
+@pytest.mark.usefixtures("db_fill")
+async def test_cursor_pagination_mixin__first_page__no_prev_cursor():
+    response = await client.get("/")
+
+    assert response.status_code == 200
+    assert "x-next-cursor" in response.headers
+    assert "x-prev-cursor" not in response.headers
+
+
+@pytest.mark.parametrize(
+    "cursor", ["abc", "e30", encode_cursor(Cursor(ordering=("id",), values=(1, 2), reverse=False))]
+)
+@pytest.mark.usefixtures("db_fill")
+async def test_cursor_pagination_mixin__cursor_invalid__error(cursor):
+    response = await client.get("/", params={"cursor": cursor})
+
+    assert response.status_code == 422
+
+    error = response.json()["detail"][0]
+    assert error["loc"] == ["query", "cursor"]
+    assert error["type"] == "value_error"
+
+
+@pytest.mark.usefixtures("db_fill")
+async def test_cursor_pagination_mixin__ordering_changed__error():
+    response = await client.get("/", params={"ordering[]": ["workers_required_min"]})
+    cursor = response.headers["x-next-cursor"]
+
+    response = await client.get("/", params={"ordering[]": ["-workers_required_min"], "cursor": cursor})
+
+    assert response.status_code == 422
+
+    error = response.json()["detail"][0]
+    assert error["loc"] == ["query", "cursor"]
+    assert error["msg"] == "Cursor does not match ordering"
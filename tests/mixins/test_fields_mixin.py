@@ -0,0 +1,108 @@
+import datetime
+import decimal
+from typing import List
+from typing import Optional
+
+import pytest
+from fastapi import FastAPI
+from httpx import AsyncClient
+from pydantic import BaseModel
+from tortoise.queryset import QuerySet
+
+from fastapi_querysets.mixins.fields import FieldsMixin
+from fastapi_querysets.mixins.ordering import OrderingMixin
+from fastapi_querysets.queryset import RouterQuerySet
+from tests.app_models.tortoise_orm import Task
+
+
+app = FastAPI()
+
+
+class TaskModelOutPartial(BaseModel):
+    id: Optional[int]
+    cost: Optional[decimal.Decimal]
+    created_at: Optional[datetime.datetime]
+    description: Optional[str]
+    is_done: Optional[bool]
+    project_id: Optional[int]
+    workers_required_min: Optional[int]
+
+    class Config:
+        orm_mode = True
+
+
+class TasksRouterQuerySet(FieldsMixin, OrderingMixin, RouterQuerySet):
+    fields_allowed = ("id", "cost", "description", "is_done", "project_id", "workers_required_min")
+    ordering_fields = ("id", "created_at", "project__description")
+    model = Task
+
+
+@app.get("/", response_model_exclude_unset=True)
+async def app_test(queryset: QuerySet[Task] = TasksRouterQuerySet()) -> List[TaskModelOutPartial]:
+    return [TaskModelOutPartial.from_orm(task) for task in await queryset]
+
+
+client = AsyncClient(app=app, base_url="http://test")
+
+
+@pytest.mark.usefixtures("db_fill")
+async def test_fields_mixin__no_fields__all_fields(mocker):
+    spy_only = mocker.spy(QuerySet, "only")
+
+    response = await client.get("/")
+
+    assert response.status_code == 200
+    assert set(response.json()[0]) == set(TaskModelOutPartial.__fields__)
+    assert not spy_only.called
+
+
+@pytest.mark.parametrize(
+    "fields, expected",
+    [
+        (["id"], ["id"]),
+        (["description"], ["id", "description"]),
+        (["is_done", "project_id"], ["id", "is_done", "project_id"]),
+        (["description", "description"], ["id", "description"]),
+    ],
+)
+@pytest.mark.usefixtures("db_fill")
+async def test_fields_mixin__fields__only_fields_selected(mocker, fields, expected):
+    spy_only = mocker.spy(QuerySet, "only")
+    tasks = await Task.all().values(*expected)
+
+    response = await client.get("/", params={"fields[]": fields})
+
+    assert response.status_code == 200
+    assert response.json() == tasks
+
+    assert spy_only.spy_return.sql() == Task.all().only(*expected).sql()
+
+
+@pytest.mark.usefixtures("db_fill")
+async def test_fields_mixin__fields_and_ordering__ordering_fields_selected():
+    response = await client.get(
+        "/",
+        params={"fields[]": ["description"], "ordering[]": ["-created_at", "project__description"]},
+    )
+
+    assert response.status_code == 200
+    assert set(response.json()[0]) == {"id", "description", "created_at"}
+
+
+@pytest.mark.parametrize(
+    "fields, index",
+    [
+        (["created_at"], 0),
+        (["id", "unknown"], 1),
+        (["description", "project__description"], 1),
+    ],
+)
+@pytest.mark.usefixtures("db_fill")
+async def test_fields_mixin__field_not_allowed__error(fields, index):
+    response = await client.get("/", params={"fields[]": fields})
+
+    assert response.status_code == 422
+
+    error = response.json()["detail"][0]
+    assert error["loc"] == ["query", "fields[]", index]
+    assert error["type"] == "value_error"
@@ -8,7 +8,9 @@ from fastapi import Query
 from httpx import AsyncClient
 from tortoise.queryset import QuerySet
 
+from fastapi_querysets.mixins import filters
 from fastapi_querysets.mixins.filters import FilterMixin
+from fastapi_querysets.mixins.filters import get_filters_index
 from fastapi_querysets.queryset import RouterQuerySet
 from tests.app_models.pydantic import WorkerModelOut
 from tests.app_models.tortoise_orm import Worker
@@ -112,3 +114,13 @@ async def test_filter_mixin__param_list_element_wrong_type__error(params):
     error = response.json()["detail"][0]
 
     assert error["loc"] == ["query", list(params.keys())[0], 0]
+
+
+def test_filter_mixin__filter_class__index_created_on_class_definition():
+    index = filters._filters_indexes.get(RouterQuerySetFilter)
+
+    assert index == {"id": "id", "id[]": "id__in", "contract": "contract_id", "name": "name"}
+    assert get_filters_index(RouterQuerySetFilter) is index
+
+    with pytest.raises(TypeError):
+        index["id"] = "name"
@@ -8,6 +8,7 @@ from fastapi import Query
 from httpx import AsyncClient
 from tortoise.queryset import QuerySet
 
+from fastapi_querysets.mixins import filters
 from fastapi_querysets.mixins.filters import FilterMixin
 from fastapi_querysets.mixins.filters import FilterNegationMixin
 from fastapi_querysets.queryset import RouterQuerySet
@@ -108,3 +109,70 @@ async def test_filter_negation_mixin__param_list_element_wrong_type__error(param
     error = response.json()["detail"][0]
 
     assert error["loc"] == ["query", list(params.keys())[0], 0]
+
+
+@dataclasses.dataclass(frozen=True)
+class RouterQuerySetExcludeCustom:
+    name: Optional[str] = Query(None, alias="name_not")
+
+
+class WorkersRouterQuerySetExcludeCustom(WorkersRouterQuerySet):
+    exclude_class = RouterQuerySetExcludeCustom
+
+
+@app.get("/custom")
+async def app_test_custom(queryset: QuerySet[Worker] = WorkersRouterQuerySetExcludeCustom()) -> List[WorkerModelOut]:
+    return await WorkerModelOut.from_queryset(queryset)
+
+
+def test_filter_negation_mixin__exclude_class__created_once_for_filter_class(mocker):
+    spy_create_negation_class = mocker.spy(filters, "create_negation_class")
+
+    class WorkersRouterQuerySetChild(WorkersRouterQuerySet):
+        pass
+
+    class WorkersRouterQuerySetOther(FilterNegationMixin, RouterQuerySet):
+        filter_class = RouterQuerySetFilter
+        model = Worker
+
+    assert WorkersRouterQuerySet.exclude_class is WorkersRouterQuerySetChild.exclude_class
+    assert WorkersRouterQuerySet.exclude_class is WorkersRouterQuerySetOther.exclude_class
+    assert WorkersRouterQuerySet().exclude_class is WorkersRouterQuerySet.exclude_class
+    assert not spy_create_negation_class.called
+
+
+def test_filter_negation_mixin__filter_class_redefined__exclude_class_redefined():
+    @dataclasses.dataclass
+    class RouterQuerySetFilterChild:
+        name: Optional[str] = Query(None)
+
+    class WorkersRouterQuerySetChild(WorkersRouterQuerySet):
+        filter_class = RouterQuerySetFilterChild
+
+    exclude_class = WorkersRouterQuerySetChild.exclude_class
+    assert exclude_class is not WorkersRouterQuerySet.exclude_class
+    assert [field.default.alias for field in dataclasses.fields(exclude_class)] == ["name!"]
+
+
+def test_filter_negation_mixin__exclude_class_declared__not_redefined():
+    class WorkersRouterQuerySetChild(WorkersRouterQuerySetExcludeCustom):
+        filter_class = RouterQuerySetFilter
+
+    assert WorkersRouterQuerySetExcludeCustom.exclude_class is RouterQuerySetExcludeCustom
+    assert WorkersRouterQuerySetChild.exclude_class is RouterQuerySetExcludeCustom
+
+
+@pytest.mark.usefixtures("db_fill")
+async def test_filter_negation_mixin__exclude_class_declared__exclude_with_params():
+    workers_ids = await Worker.exclude(name="Test Worker 1").order_by("id").values_list("id", flat=True)
+
+    response = await client.get("/custom", params={"name_not": "Test Worker 1", "name!": "Test Worker 2"})
+
+    assert response.status_code == 200
+    assert sorted([worker["id"] for worker in response.json()]) == workers_ids
+
+
+def test_filter_negation_mixin__exclude_class__index_created_on_class_definition():
+    index = filters._filters_indexes.get(WorkersRouterQuerySet.exclude_class)
+
+    assert index == {"id!": "id", "id[]!": "id__in", "contract!": "contract_id", "name!": "name"}
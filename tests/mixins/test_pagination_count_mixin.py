@@ -0,0 +1,272 @@
+import dataclasses
+import math
+from typing import List
+from typing import Optional
+
+import pytest
+from fastapi import FastAPI
+from fastapi import Query
+from httpx import AsyncClient
+from tortoise.queryset import QuerySet
+
+from fastapi_querysets.cache import MemoryCache
+from fastapi_querysets.mixins.filters import FilterMixin
+from fastapi_querysets.mixins.pagination import COUNT_APPROXIMATE
+from fastapi_querysets.mixins.pagination import COUNT_EXACT
+from fastapi_querysets.mixins.pagination import COUNT_LAZY
+from fastapi_querysets.mixins.pagination import COUNT_NONE
+from fastapi_querysets.mixins.pagination import PaginationMixin
+from fastapi_querysets.mixins.pagination import RouterPagination
+from fastapi_querysets.queryset import RouterQuerySet
+from fastapi_querysets.utils import get_count_estimate
+from tests.app_models.pydantic import WorkerModelOut
+from tests.app_models.tortoise_orm import Worker
+
+app = FastAPI()
+
+
+class TestRouterPagination(RouterPagination):
+    per_page = 25
+    per_page_max = 200
+
+
+class WorkersRouterQuerySet(PaginationMixin, RouterQuerySet):
+    pagination_class = TestRouterPagination
+    model = Worker
+
+    def get_queryset(self):
+        return Worker.all().order_by("id")
+
+
+@dataclasses.dataclass
+class RouterQuerySetFilter:
+    id__lte: Optional[int] = Query(None)
+    name: Optional[str] = Query(None)
+
+
+class TestRouterPaginationCached(TestRouterPagination):
+    count_cache = MemoryCache()
+
+
+class WorkersRouterQuerySetCached(FilterMixin, WorkersRouterQuerySet):
+    filter_class = RouterQuerySetFilter
+    pagination_class = TestRouterPaginationCached
+
+
+@app.get("/exact")
+async def app_test_exact(
+    queryset: QuerySet[Worker] = WorkersRouterQuerySet(count=COUNT_EXACT).paginated,
+) -> List[WorkerModelOut]:
+    return await WorkerModelOut.from_queryset(queryset)
+
+
+@app.get("/none")
+async def app_test_none(
+    queryset: QuerySet[Worker] = WorkersRouterQuerySet(count=COUNT_NONE).paginated,
+) -> List[WorkerModelOut]:
+    return await WorkerModelOut.from_queryset(queryset)
+
+
+@app.get("/lazy")
+async def app_test_lazy(
+    queryset: QuerySet[Worker] = WorkersRouterQuerySet(count=COUNT_LAZY).paginated,
+) -> List[WorkerModelOut]:
+    return await WorkerModelOut.from_queryset(queryset)
+
+
+@app.get("/short")
+async def app_test_short_page(
+    queryset: QuerySet[Worker] = WorkersRouterQuerySet(count_short_page=True).paginated,
+) -> List[WorkerModelOut]:
+    return await WorkerModelOut.from_queryset(queryset)
+
+
+@app.get("/approximate")
+async def app_test_approximate(
+    queryset: QuerySet[Worker] = WorkersRouterQuerySet(count=COUNT_APPROXIMATE).paginated,
+) -> List[WorkerModelOut]:
+    return await WorkerModelOut.from_queryset(queryset)
+
+
+@app.get("/cached")
+async def app_test_cached(
+    queryset: QuerySet[Worker] = WorkersRouterQuerySetCached().paginated,
+) -> List[WorkerModelOut]:
+    return await WorkerModelOut.from_queryset(queryset)
+
+
+client = AsyncClient(app=app, base_url="http://test")
+
+
+@pytest.fixture(autouse=True)
+async def count_cache_clear():
+    await TestRouterPaginationCached.count_cache.clear()
+
+
+@pytest.mark.parametrize("params", [{}, {"with_total": 1}])
+@pytest.mark.usefixtures("db_create_workers")
+async def test_pagination_count__none__no_total_headers(mocker, params):
+    spy_count = mocker.spy(QuerySet, "count")
+    workers_ids = await Worker.all().order_by("id").limit(TestRouterPagination.per_page).values_list("id", flat=True)
+
+    response = await client.get("/none", params=params)
+
+    assert response.status_code == 200
+    assert [worker["id"] for worker in response.json()] == workers_ids
+    assert response.headers["x-page"] == "1"
+    assert response.headers["x-per-page"] == str(TestRouterPagination.per_page)
+    assert "x-pages" not in response.headers
+    assert "x-total" not in response.headers
+    assert not spy_count.called
+
+
+@pytest.mark.usefixtures("db_create_workers")
+async def test_pagination_count__lazy_without_flag__no_total_headers(mocker):
+    spy_count = mocker.spy(QuerySet, "count")
+
+    response = await client.get("/lazy", params={"page": 2})
+
+    assert response.status_code == 200
+    assert response.headers["x-page"] == "2"
+    assert "x-pages" not in response.headers
+    assert "x-total" not in response.headers
+    assert not spy_count.called
+
+
+@pytest.mark.parametrize("path", ["/exact", "/lazy"])
+@pytest.mark.usefixtures("db_create_workers")
+async def test_pagination_count__total_required__total_headers(path):
+    workers_total = await Worker.all().count()
+
+    response = await client.get(path, params={"page": 2, "with_total": 1})
+
+    assert response.status_code == 200
+    assert response.headers["x-page"] == "2"
+    assert response.headers["x-pages"] == str(math.ceil(workers_total / TestRouterPagination.per_page))
+    assert response.headers["x-total"] == str(workers_total)
+
+
+@pytest.mark.usefixtures("db_create_workers")
+async def test_pagination_count__short_first_page__total_without_count(mocker):
+    spy_count = mocker.spy(QuerySet, "count")
+    workers_ids = await Worker.all().order_by("id").values_list("id", flat=True)
+
+    response = await client.get("/short", params={"per_page": len(workers_ids) + 1})
+
+    assert response.status_code == 200
+    assert [worker["id"] for worker in response.json()] == workers_ids
+    assert response.headers["x-pages"] == "1"
+    assert response.headers["x-total"] == str(len(workers_ids))
+    assert not spy_count.called
+
+
+@pytest.mark.parametrize("page", [1, 2])
+@pytest.mark.usefixtures("db_create_workers")
+async def test_pagination_count__short_page_not_short__total_counted(mocker, page):
+    spy_count = mocker.spy(QuerySet, "count")
+    workers_ids = (
+        await Worker.all()
+        .order_by("id")
+        .offset((page - 1) * TestRouterPagination.per_page)
+        .limit(TestRouterPagination.per_page)
+        .values_list("id", flat=True)
+    )
+    workers_total = await Worker.all().count()
+
+    response = await client.get("/short", params={"page": page})
+
+    assert response.status_code == 200
+    assert [worker["id"] for worker in response.json()] == workers_ids
+    assert response.headers["x-total"] == str(workers_total)
+    assert spy_count.call_count == 2
+
+
+@pytest.mark.usefixtures("db_clean")
+async def test_pagination_count__short_page_db_is_clean__headers_is_zeros():
+    response = await client.get("/short")
+
+    assert response.status_code == 200
+    assert not response.json()
+    assert response.headers["x-pages"] == "0"
+    assert response.headers["x-total"] == "0"
+
+
+@pytest.mark.usefixtures("db_create_workers")
+async def test_pagination_count__estimate_sqlite__none():
+    assert await get_count_estimate(Worker.all()) is None
+
+
+@pytest.mark.usefixtures("db_create_workers")
+async def test_pagination_count__approximate_no_estimate__exact_total():
+    workers_total = await Worker.all().count()
+
+    response = await client.get("/approximate")
+
+    assert response.status_code == 200
+    assert response.headers["x-total"] == str(workers_total)
+    assert response.headers["x-total-approximate"] == "false"
+
+
+@pytest.mark.usefixtures("db_create_workers")
+async def test_pagination_count__approximate_estimate_gte_threshold__estimated_total(mocker):
+    estimate = TestRouterPagination.count_approximate_threshold + 1
+    mocker.patch("fastapi_querysets.mixins.pagination.get_count_estimate", return_value=estimate)
+    spy_count = mocker.spy(QuerySet, "count")
+
+    response = await client.get("/approximate")
+
+    assert response.status_code == 200
+    assert response.headers["x-pages"] == str(math.ceil(estimate / TestRouterPagination.per_page))
+    assert response.headers["x-total"] == str(estimate)
+    assert response.headers["x-total-approximate"] == "true"
+    assert not spy_count.called
+
+
+@pytest.mark.usefixtures("db_create_workers")
+async def test_pagination_count__approximate_estimate_lt_threshold__exact_total(mocker):
+    mocker.patch(
+        "fastapi_querysets.mixins.pagination.get_count_estimate",
+        return_value=TestRouterPagination.count_approximate_threshold - 1,
+    )
+    workers_total = await Worker.all().count()
+
+    response = await client.get("/approximate")
+
+    assert response.status_code == 200
+    assert response.headers["x-total"] == str(workers_total)
+    assert response.headers["x-total-approximate"] == "false"
+
+
+@pytest.mark.usefixtures("db_create_workers")
+async def test_pagination_count__cached__count_once_for_all_pages(mocker):
+    spy_count = mocker.spy(QuerySet, "count")
+    workers_total = await Worker.filter(id__lte=60).count()
+
+    for page in (1, 2, 3):
+        response = await client.get("/cached", params={"id__lte": 60, "page": page})
+
+        assert response.status_code == 200
+        assert response.headers["x-total"] == str(workers_total)
+        assert response.headers["x-page"] == str(page)
+
+    assert spy_count.call_count == 2
+
+
+@pytest.mark.usefixtures("db_create_workers")
+async def test_pagination_count__cached_filters_changed__counted_again(mocker):
+    spy_count = mocker.spy(QuerySet, "count")
+
+    response = await client.get("/cached", params={"id__lte": 60})
+    assert response.headers["x-total"] == "60"
+
+    response = await client.get("/cached", params={"id__lte": 30})
+    assert response.headers["x-total"] == "30"
+
+    response = await client.get("/cached", params={"id__lte": 30, "name": "Test Worker 1"})
+    assert response.headers["x-total"] == "1"
+
+    response = await client.get("/cached", params={"name": "Test Worker 1", "id__lte": 30, "page": 2})
+    assert response.headers["x-total"] == "1"
+
+    assert spy_count.call_count == 3
+    assert len(TestRouterPaginationCached.count_cache) == 3
@@ -0,0 +1,110 @@
+import asyncio
+import math
+from typing import List
+
+import pytest
+from fastapi import FastAPI
+from httpx import AsyncClient
+from tortoise.queryset import QuerySet
+
+from fastapi_querysets.mixins.pagination import COUNT_NONE
+from fastapi_querysets.mixins.pagination import Page
+from fastapi_querysets.mixins.pagination import PaginationMixin
+from fastapi_querysets.mixins.pagination import RouterPagination
+from fastapi_querysets.queryset import RouterQuerySet
+from tests.app_models.pydantic import WorkerModelOut
+from tests.app_models.tortoise_orm import Worker
+
+app = FastAPI()
+
+
+class TestRouterPagination(RouterPagination):
+    per_page = 25
+    per_page_max = 50
+    concurrent = True
+
+
+class WorkersRouterQuerySet(PaginationMixin, RouterQuerySet):
+    pagination_class = TestRouterPagination
+    model = Worker
+
+    def get_queryset(self):
+        return Worker.all().order_by("id")
+
+
+@app.get("/")
+async def app_test(page: Page = WorkersRouterQuerySet().paginated) -> List[WorkerModelOut]:
+    return [WorkerModelOut.from_orm(worker) for worker in await page]
+
+
+@app.get("/count-none")
+async def app_test_count_none(page: Page = WorkersRouterQuerySet(count=COUNT_NONE).paginated) -> List[WorkerModelOut]:
+    return [WorkerModelOut.from_orm(worker) for worker in await page]
+
+
+@app.get("/not-fetched")
+async def app_test_not_fetched(page: Page = WorkersRouterQuerySet().paginated) -> List[WorkerModelOut]:
+    return []
+
+
+client = AsyncClient(app=app, base_url="http://test")
+
+
+@pytest.mark.parametrize("page", [1, 2, 5])
+@pytest.mark.usefixtures("db_create_workers")
+async def test_pagination_page__concurrent__rows_and_headers(mocker, page):
+    spy_gather = mocker.spy(asyncio, "gather")
+    workers_ids = (
+        await Worker.all()
+        .order_by("id")
+        .offset((page - 1) * TestRouterPagination.per_page)
+        .limit(TestRouterPagination.per_page)
+        .values_list("id", flat=True)
+    )
+    workers_total = await Worker.all().count()
+
+    response = await client.get("/", params={"page": page})
+
+    assert response.status_code == 200
+    assert [worker["id"] for worker in response.json()] == workers_ids
+    assert response.headers["x-page"] == str(page)
+    assert response.headers["x-pages"] == str(math.ceil(workers_total / TestRouterPagination.per_page))
+    assert response.headers["x-per-page"] == str(TestRouterPagination.per_page)
+    assert response.headers["x-total"] == str(workers_total)
+    assert spy_gather.called
+
+
+@pytest.mark.usefixtures("db_create_workers")
+async def test_pagination_page__total_not_required__only_rows(mocker):
+    spy_count = mocker.spy(QuerySet, "count")
+
+    response = await client.get("/count-none")
+
+    assert response.status_code == 200
+    assert len(response.json()) == TestRouterPagination.per_page
+    assert response.headers["x-page"] == "1"
+    assert "x-total" not in response.headers
+    assert not spy_count.called
+
+
+@pytest.mark.usefixtures("db_create_workers")
+async def test_pagination_page__not_fetched__no_queries(mocker):
+    spy_count = mocker.spy(QuerySet, "count")
+
+    response = await client.get("/not-fetched")
+
+    assert response.status_code == 200
+    assert response.headers["x-page"] == "1"
+    assert "x-total" not in response.headers
+    assert not spy_count.called
+
+
+@pytest.mark.usefixtures("db_create_workers")
+async def test_pagination_page__awaited_twice__fetched_once(mocker):
+    get_total = mocker.AsyncMock(return_value=(100, False))
+    on_total = mocker.Mock()
+    page = Page(Worker.all().order_by("id").limit(5), get_total=get_total, on_total=on_total)
+
+    assert [worker.id for worker in await page] == [worker.id for worker in await page.fetch()] == [1, 2, 3, 4, 5]
+    get_total.assert_awaited_once_with()
+    on_total.assert_called_once_with(100, False)
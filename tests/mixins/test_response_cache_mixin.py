@@ -0,0 +1,152 @@
+import dataclasses
+from typing import List
+from typing import Optional
+
+import pytest
+from fastapi import FastAPI
+from fastapi import Query
+from httpx import AsyncClient
+
+from fastapi_querysets.cache import MemoryCache
+from fastapi_querysets.mixins.caching import ResponseCache
+from fastapi_querysets.mixins.caching import ResponseCacheMixin
+from fastapi_querysets.mixins.filters import FilterMixin
+from fastapi_querysets.mixins.pagination import PaginationMixin
+from fastapi_querysets.mixins.pagination import RouterPagination
+from fastapi_querysets.queryset import RouterQuerySet
+from tests.app_models.pydantic import WorkerModelOut
+from tests.app_models.tortoise_orm import Worker
+
+app = FastAPI()
+
+
+@dataclasses.dataclass
+class RouterQuerySetFilter:
+    id__lte: Optional[int] = Query(None)
+
+
+class TestRouterPagination(RouterPagination):
+    per_page = 10
+    per_page_max = 50
+
+
+class WorkersRouterQuerySet(ResponseCacheMixin, FilterMixin, PaginationMixin, RouterQuerySet):
+    filter_class = RouterQuerySetFilter
+    pagination_class = TestRouterPagination
+    response_cache = MemoryCache()
+    model = Worker
+
+    def get_queryset(self):
+        return Worker.all().order_by("id")
+
+
+workers = WorkersRouterQuerySet()
+
+
+@app.get("/")
+async def app_test(cache: ResponseCache = workers.cached(workers.paginated)) -> List[WorkerModelOut]:
+    return await cache.response(WorkerModelOut.from_queryset)
+
+
+client = AsyncClient(app=app, base_url="http://test")
+
+
+@pytest.fixture(autouse=True)
+async def response_cache_clear():
+    # fixtures create workers by bulk operations, which don't send signals
+    await WorkersRouterQuerySet.response_cache.clear()
+
+
+@pytest.mark.usefixtures("db_create_workers")
+async def test_response_cache_mixin__second_request__cached(mocker):
+    spy_serializer = mocker.spy(WorkerModelOut, "from_queryset")
+    workers_ids = await Worker.all().order_by("id").limit(TestRouterPagination.per_page).values_list("id", flat=True)
+
+    response = await client.get("/")
+    response_cached = await client.get("/")
+
+    assert response.status_code == response_cached.status_code == 200
+    assert [worker["id"] for worker in response.json()] == workers_ids
+    assert response_cached.json() == response.json()
+    assert response_cached.headers["etag"] == response.headers["etag"]
+    assert response_cached.headers["x-page"] == response.headers["x-page"] == "1"
+    assert response_cached.headers["x-total"] == response.headers["x-total"] == "100"
+    assert spy_serializer.call_count == 1
+
+
+@pytest.mark.usefixtures("db_create_workers")
+async def test_response_cache_mixin__if_none_match__not_modified(mocker):
+    response = await client.get("/", params={"page": 2})
+    spy_serializer = mocker.spy(WorkerModelOut, "from_queryset")
+
+    response_not_modified = await client.get(
+        "/", params={"page": 2}, headers={"if-none-match": response.headers["etag"]}
+    )
+
+    assert response_not_modified.status_code == 304
+    assert not response_not_modified.content
+    assert response_not_modified.headers["etag"] == response.headers["etag"]
+    assert not spy_serializer.called
+
+
+@pytest.mark.parametrize(
+    "params",
+    [{"page": 2}, {"per_page": 20}, {"id__lte": 50}, {"with_total": 1}],
+)
+@pytest.mark.usefixtures("db_create_workers")
+async def test_response_cache_mixin__params_changed__other_etag(params):
+    response = await client.get("/")
+
+    response_other = await client.get("/", params=params, headers={"if-none-match": response.headers["etag"]})
+
+    assert response_other.status_code == 200
+    assert response_other.headers["etag"] != response.headers["etag"]
+
+
+@pytest.mark.usefixtures("db_create_workers")
+async def test_response_cache_mixin__params_reordered__same_etag():
+    response = await client.get("/", params={"id__lte": 50, "page": 2})
+
+    response_other = await client.get("/", params={"page": 2, "id__lte": 50})
+
+    assert response_other.headers["etag"] == response.headers["etag"]
+
+
+@pytest.mark.usefixtures("db_create_workers")
+async def test_response_cache_mixin__instance_saved__invalidated():
+    response = await client.get("/")
+
+    worker = await Worker.get(id=1)
+    worker.name = "Test Worker Updated"
+    await worker.save()
+
+    response_updated = await client.get("/", headers={"if-none-match": response.headers["etag"]})
+
+    assert response_updated.status_code == 200
+    assert response_updated.headers["etag"] != response.headers["etag"]
+    assert response_updated.json()[0]["name"] == "Test Worker Updated"
+
+
+@pytest.mark.usefixtures("db_create_workers")
+async def test_response_cache_mixin__instance_deleted__invalidated():
+    response = await client.get("/")
+
+    await (await Worker.get(id=1)).delete()
+
+    response_updated = await client.get("/")
+
+    assert response_updated.headers["etag"] != response.headers["etag"]
+    assert response_updated.json()[0]["id"] == 2
+
+
+@pytest.mark.usefixtures("db_create_workers")
+async def test_response_cache_mixin__invalidate__invalidated():
+    response = await client.get("/")
+
+    await Worker.filter(id=1).update(name="Test Worker Updated")
+    await workers.invalidate()
+
+    response_updated = await client.get("/")
+
+    assert response_updated.headers["etag"] != response.headers["etag"]
+    assert response_updated.json()[0]["name"] == "Test Worker Updated"
@@ -0,0 +1,83 @@
+import json
+
+import pytest
+from fastapi import FastAPI
+from fastapi.encoders import jsonable_encoder
+from httpx import AsyncClient
+from tortoise.queryset import QuerySet
+
+from fastapi_querysets.mixins.ordering import OrderingMixin
+from fastapi_querysets.mixins.streaming import STREAM_JSON
+from fastapi_querysets.mixins.streaming import QuerySetStream
+from fastapi_querysets.mixins.streaming import StreamingMixin
+from fastapi_querysets.queryset import RouterQuerySet
+from tests.app_models.pydantic import TaskModelOut
+from tests.app_models.tortoise_orm import Task
+
+app = FastAPI()
+
+
+class TasksRouterQuerySet(OrderingMixin, StreamingMixin, RouterQuerySet):
+    ordering_fields = ("id", "created_at", "workers_required_min")
+    stream_chunk_size = 15
+    model = Task
+
+
+@app.get("/ndjson")
+async def app_test_ndjson(stream: QuerySetStream = TasksRouterQuerySet().streaming):
+    return stream.response(TaskModelOut.from_orm)
+
+
+@app.get("/json")
+async def app_test_json(stream: QuerySetStream = TasksRouterQuerySet().streaming):
+    return stream.response(TaskModelOut.from_orm, format=STREAM_JSON)
+
+
+client = AsyncClient(app=app, base_url="http://test")
+
+
+@pytest.mark.parametrize(
+    "ordering",
+    [None, ("-id",), ("workers_required_min",), ("-workers_required_min", "created_at")],
+)
+@pytest.mark.usefixtures("db_fill")
+async def test_streaming_mixin__ndjson__all_rows_in_order(mocker, ordering):
+    tasks_ids = await Task.all().order_by(*(ordering or ()), "id").values_list("id", flat=True)
+    spy_execute = mocker.spy(QuerySet, "_execute")
+
+    response = await client.get("/ndjson", params={"ordering[]": ordering} if ordering else {})
+
+    assert response.status_code == 200
+    assert response.headers["content-type"] == "application/x-ndjson"
+    assert [json.loads(line)["id"] for line in response.text.splitlines()] == tasks_ids
+    assert spy_execute.call_count == len(tasks_ids) // TasksRouterQuerySet.stream_chunk_size + 1
+
+
+@pytest.mark.usefixtures("db_fill")
+async def test_streaming_mixin__json__array_of_rows():
+    tasks = await TaskModelOut.from_queryset(Task.all().order_by("id"))
+
+    response = await client.get("/json")
+
+    assert response.status_code == 200
+    assert response.headers["content-type"] == "application/json"
+    assert response.json() == jsonable_encoder(tasks)
+
+
+@pytest.mark.parametrize("path, expected", [("/ndjson", ""), ("/json", "[]")])
+@pytest.mark.usefixtures("db_clean")
+async def test_streaming_mixin__db_is_clean__empty(path, expected):
+    response = await client.get(path)
+
+    assert response.status_code == 200
+    assert response.text == expected
+
+
+@pytest.mark.usefixtures("db_fill")
+async def test_streaming_mixin__chunks__size_limited():
+    stream = QuerySetStream(Task.all(), "id", 30)
+
+    chunks = [[task.id for task in chunk] async for chunk in stream.chunks()]
+
+    assert [len(chunk) for chunk in chunks] == [30, 30, 30, 10]
+    assert sum(chunks, []) == list(range(1, 101))
@@ -0,0 +1,122 @@
+from typing import List
+from typing import Optional
+
+import pytest
+from fastapi import FastAPI
+from fastapi.encoders import jsonable_encoder
+from httpx import AsyncClient
+from pydantic import BaseModel
+from pydantic import Field
+from tortoise import Model
+
+from fastapi_querysets.mixins.fields import FieldsMixin
+from fastapi_querysets.mixins.pagination import PaginationMixin
+from fastapi_querysets.mixins.pagination import RouterPagination
+from fastapi_querysets.mixins.values import QuerySetValues
+from fastapi_querysets.mixins.values import ValuesMixin
+from fastapi_querysets.queryset import RouterQuerySet
+from tests.app_models.pydantic import TaskModelOut
+from tests.app_models.tortoise_orm import Task
+
+
+app = FastAPI()
+
+
+class TestRouterPagination(RouterPagination):
+    per_page = 10
+    per_page_max = 50
+
+
+class TasksRouterQuerySet(FieldsMixin, ValuesMixin, PaginationMixin, RouterQuerySet):
+    fields_allowed = ("id", "description", "project_id")
+    pagination_class = TestRouterPagination
+    values_model = TaskModelOut
+    model = Task
+
+    def get_queryset(self):
+        return Task.all().order_by("id")
+
+
+tasks = TasksRouterQuerySet()
+tasks_concurrent = TasksRouterQuerySet(concurrent=True)
+
+
+@app.get("/")
+async def app_test(values: QuerySetValues = tasks.as_values()) -> List[TaskModelOut]:
+    return await values.response()
+
+
+@app.get("/paginated")
+async def app_test_paginated(values: QuerySetValues = tasks.as_values(tasks.paginated)) -> List[TaskModelOut]:
+    return await values.response()
+
+
+@app.get("/concurrent")
+async def app_test_concurrent(
+    values: QuerySetValues = tasks_concurrent.as_values(tasks_concurrent.paginated),
+) -> List[TaskModelOut]:
+    return await values.response()
+
+
+client = AsyncClient(app=app, base_url="http://test")
+
+
+@pytest.mark.usefixtures("db_fill")
+async def test_values_mixin__response__same_as_model(mocker):
+    spy_init = mocker.spy(Model, "__init__")
+    expected = jsonable_encoder(await TaskModelOut.from_queryset(Task.all().order_by("id")))
+    spy_init.reset_mock()
+
+    response = await client.get("/")
+
+    assert response.status_code == 200
+    assert response.json() == expected
+    assert not spy_init.called
+
+
+@pytest.mark.parametrize("path", ["/paginated", "/concurrent"])
+@pytest.mark.usefixtures("db_fill")
+async def test_values_mixin__paginated__page_with_headers(path):
+    expected = jsonable_encoder(await TaskModelOut.from_queryset(Task.all().order_by("id").offset(10).limit(10)))
+
+    response = await client.get(path, params={"page": 2})
+
+    assert response.status_code == 200
+    assert response.json() == expected
+    assert response.headers["x-page"] == "2"
+    assert response.headers["x-total"] == "100"
+
+
+@pytest.mark.usefixtures("db_fill")
+async def test_values_mixin__fields__only_fields_fetched():
+    expected = await Task.all().order_by("id").values("id", "description")
+
+    response = await client.get("/", params={"fields[]": ["description"]})
+
+    assert response.status_code == 200
+    assert response.json() == expected
+
+
+def test_values_mixin__alias__values_by_alias():
+    class TaskValuesOut(BaseModel):
+        id: int
+        title: str = Field(alias="description")
+
+    class TaskValuesRouterQuerySet(ValuesMixin, RouterQuerySet):
+        values_model = TaskValuesOut
+        model = Task
+
+    assert TaskValuesRouterQuerySet()._values_fields == {"id": "id", "description": "title"}
+
+
+def test_values_mixin__not_model_field__error():
+    class TaskValuesOut(BaseModel):
+        id: int
+        title: Optional[str]
+
+    class TaskValuesRouterQuerySet(ValuesMixin, RouterQuerySet):
+        values_model = TaskValuesOut
+        model = Task
+
+    with pytest.raises(ValueError):
+        TaskValuesRouterQuerySet()
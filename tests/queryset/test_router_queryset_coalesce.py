@@ -0,0 +1,86 @@
+import asyncio
+
+import pytest
+from fastapi import FastAPI
+from httpx import AsyncClient
+from tortoise.queryset import QuerySet
+
+from fastapi_querysets.coalescing import singleflight
+from fastapi_querysets.queryset import RouterQuerySet
+from tests.app_models.pydantic import WorkerModelOut
+from tests.app_models.tortoise_orm import Worker
+
+app = FastAPI()
+
+
+class WorkersRouterQuerySet(RouterQuerySet):
+    model = Worker
+
+
+workers = WorkersRouterQuerySet(coalesce=True)
+
+
+@app.get("/{instance_pk}")
+async def app_test_retrieve(instance: Worker = workers.instance) -> WorkerModelOut:
+    return await WorkerModelOut.from_tortoise_orm(instance)
+
+
+client = AsyncClient(app=app, base_url="http://test")
+
+
+@pytest.mark.usefixtures("db_create_workers")
+async def test_router_queryset_coalesce__identical_queries__executed_once(mocker):
+    expected = await Worker.filter(id__lte=10).order_by("id").values_list("id", flat=True)
+    spy_execute = mocker.spy(QuerySet, "_execute")
+
+    results = await asyncio.gather(
+        *(workers._execute(Worker.filter(id__lte=10).order_by("id"), "rows") for _ in range(5))
+    )
+
+    assert spy_execute.call_count == 1
+    assert all([worker.id for worker in result] == expected for result in results)
+    assert len({id(result) for result in results}) == 5
+    assert not len(singleflight)
+
+
+@pytest.mark.usefixtures("db_create_workers")
+async def test_router_queryset_coalesce__different_queries__executed_separately(mocker):
+    spy_execute = mocker.spy(QuerySet, "_execute")
+
+    rows, instance, count = await asyncio.gather(
+        workers._execute(Worker.filter(id=1), "rows"),
+        workers._execute(Worker.all().get_or_none(id=1), "instance"),
+        workers._execute(Worker.filter(id=1).count(), "count"),
+    )
+
+    assert spy_execute.call_count == 2
+    assert [worker.id for worker in rows] == [1]
+    assert instance.id == 1
+    assert count == 1
+
+
+@pytest.mark.usefixtures("db_create_workers")
+async def test_router_queryset_coalesce__disabled__executed_for_every_query(mocker):
+    spy_execute = mocker.spy(QuerySet, "_execute")
+
+    await asyncio.gather(*(WorkersRouterQuerySet()._execute(Worker.filter(id=1), "rows") for _ in range(3)))
+
+    assert spy_execute.call_count == 3
+
+
+@pytest.mark.usefixtures("db_create_workers")
+async def test_router_queryset_coalesce__query_failed__error_for_every_query():
+    queries = (workers._execute(Worker.filter(unknown=1), "rows") for _ in range(3))
+
+    results = await asyncio.gather(*queries, return_exceptions=True)
+
+    assert all(isinstance(result, Exception) for result in results)
+    assert not len(singleflight)
+
+
+@pytest.mark.usefixtures("db_create_workers")
+async def test_router_queryset_coalesce__concurrent_requests__instances():
+    responses = await asyncio.gather(*(client.get(f"/{pk}") for pk in (1, 1, 2, 2, 404)))
+
+    assert [response.status_code for response in responses] == [200, 200, 200, 200, 404]
+    assert [response.json().get("id") for response in responses[:4]] == [1, 1, 2, 2]